@@ -1,6 +1,9 @@
 """Main CLI entry point for Gentem."""
 
+import copy
+import sys
 from pathlib import Path
+from typing import Optional
 
 import typer
 
@@ -14,6 +17,31 @@ app = typer.Typer(
     no_args_is_help=True,
 )
 
+# Options shared by several commands, built once at import
+_AUTHOR_OPTION = typer.Option(
+    "",
+    "--author",
+    "-a",
+    help="Author name for the project.",
+)
+_DESCRIPTION_OPTION = typer.Option(
+    "",
+    "--description",
+    "-d",
+    help="Description for the project.",
+)
+_DRY_RUN_OPTION = typer.Option(
+    False,
+    "--dry-run",
+    help="Preview the project structure without creating files.",
+)
+_VERBOSE_OPTION = typer.Option(
+    False,
+    "--verbose",
+    "-v",
+    help="Show verbose output.",
+)
+
 
 def version_callback(value: bool) -> None:
     """Print the version of gentem."""
@@ -49,35 +77,16 @@ def new_command(
         "-t",
         help="Project type: library, cli, or script.",
     ),
-    author: str = typer.Option(
-        "",
-        "--author",
-        "-a",
-        help="Author name for the project.",
-    ),
-    description: str = typer.Option(
-        "",
-        "--description",
-        "-d",
-        help="Description for the project.",
-    ),
+    author: str = _AUTHOR_OPTION,
+    description: str = _DESCRIPTION_OPTION,
     license_type: str = typer.Option(
         "mit",
         "--license",
         "-l",
         help="License type: mit, apache, gpl, bsd, or none.",
     ),
-    dry_run: bool = typer.Option(
-        False,
-        "--dry-run",
-        help="Preview the project structure without creating files.",
-    ),
-    verbose: bool = typer.Option(
-        False,
-        "--verbose",
-        "-v",
-        help="Show verbose output.",
-    ),
+    dry_run: bool = _DRY_RUN_OPTION,
+    verbose: bool = _VERBOSE_OPTION,
 ) -> None:
     """Create a new Python project."""
     from gentem.commands.new_jinja2 import create_new_project
@@ -115,29 +124,10 @@ def fastapi_command(
         "-D",
         help="Database type: asyncpg (for async SQLAlchemy).",
     ),
-    author: str = typer.Option(
-        "",
-        "--author",
-        "-a",
-        help="Author name for the project.",
-    ),
-    description: str = typer.Option(
-        "",
-        "--description",
-        "-d",
-        help="Description for the project.",
-    ),
-    dry_run: bool = typer.Option(
-        False,
-        "--dry-run",
-        help="Preview the project structure without creating files.",
-    ),
-    verbose: bool = typer.Option(
-        False,
-        "--verbose",
-        "-v",
-        help="Show verbose output.",
-    ),
+    author: str = _AUTHOR_OPTION,
+    description: str = _DESCRIPTION_OPTION,
+    dry_run: bool = _DRY_RUN_OPTION,
+    verbose: bool = _VERBOSE_OPTION,
 ) -> None:
     """Create a new FastAPI project with opinionated structure."""
     from gentem.commands.fastapi_jinja2 import create_fastapi_project
@@ -172,17 +162,8 @@ def init_command(
         "-p",
         help="Preset to use: minimal, cli-tool, fastapi.",
     ),
-    dry_run: bool = typer.Option(
-        False,
-        "--dry-run",
-        help="Preview the project structure without creating files.",
-    ),
-    verbose: bool = typer.Option(
-        False,
-        "--verbose",
-        "-v",
-        help="Show verbose output.",
-    ),
+    dry_run: bool = _DRY_RUN_OPTION,
+    verbose: bool = _VERBOSE_OPTION,
 ) -> None:
     """Interactive wizard for creating new projects."""
     from gentem.commands.init import run_init
@@ -217,12 +198,7 @@ def add_command(
         "--dry-run",
         help="Preview the changes without creating files.",
     ),
-    verbose: bool = typer.Option(
-        False,
-        "--verbose",
-        "-v",
-        help="Show verbose output.",
-    ),
+    verbose: bool = _VERBOSE_OPTION,
     force: bool = typer.Option(
         False,
         "--force",
@@ -256,8 +232,29 @@ def add_command(
         )
 
 
+def _sniff_subcommand(args: list[str]) -> Optional[str]:
+    """Return the subcommand named on the command line, if any.
+
+    The top-level callback only takes flags, so the first non-option
+    argument is the subcommand.
+    """
+    for arg in args:
+        if not arg.startswith("-"):
+            return arg
+    return None
+
+
 def main():
-    app()
+    # Only build the Click command for the subcommand being invoked; fall back
+    # to all commands for --help, --version or unknown names.
+    # The trimmed list goes on a shallow copy so the module-level app keeps
+    # every command for later calls in the same process.
+    command = _sniff_subcommand(sys.argv[1:])
+    invoked = app
+    if command is not None and any(c.name == command for c in app.registered_commands):
+        invoked = copy.copy(app)
+        invoked.registered_commands = [c for c in app.registered_commands if c.name == command]
+    invoked()
 
 
 if __name__ == "__main__":
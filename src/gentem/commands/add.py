@@ -1,206 +1,424 @@
 """Implementation of the `gentem add` command to add modules to existing projects."""
 
+import functools
 import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
-from rich import print
-from rich.panel import Panel
+import typer
 
-from gentem.template_engine import TemplateEngine
+from gentem.utils.validators import (
+    _VALID_MODULES as VALID_MODULES,  # noqa: F401 - kept as a public alias
+)
 from gentem.utils.validators import (
     ValidationError,
     validate_module_type,
     validate_project_path,
 )
 
+if TYPE_CHECKING:
+    from gentem.template_engine import TemplateEngine
+
+
+# Simple ``key = "value"`` fields read from pyproject.toml
+_PYPROJECT_FIELD_RE = re.compile(
+    r'(?P<key>name|author|email|description|version)\s*=\s*["\'](?P<value>[^"\']+)["\']'
+)
+
+# Python requirement, e.g. ``python = "^3.10"``
+_PYTHON_VERSION_RE = re.compile(r'python\s*["\']?\^?["\']?\s*["\']?([0-9.]+)["\']?')
+
+# First version number in a requirement such as ``>=3.10`` or ``^3.11``
+_VERSION_NUMBER_RE = re.compile(r"[0-9]+(?:\.[0-9]+)*")
+
+# Markers used to guess the project type; only "fastapi" is case-insensitive
+_PROJECT_TYPE_MARKER_RE = re.compile(
+    r"(?P<fastapi>(?i:fastapi))"
+    r"|(?P<cli>project\.scripts|console_scripts)"
+    r"|(?P<py>py\.)"
+    r"|(?P<dependencies>dependencies)"
+)
+
+# Month names for the template context (avoids locale lookups in strftime)
+_MONTHS = (
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
 
-# Valid module types
-VALID_MODULES = {
-    "docker",
-    "docs",
-    "testing",
-    "logging",
-    "database",
-    "ci",
-    "precommit",
-    "poetry",
+# Parsed pyproject.toml files keyed by (path, mtime_ns, size)
+_PYPROJECT_CACHE: dict[tuple[str, int, int], tuple[str, Optional[dict[str, Any]]]] = {}
+
+# Default project information, copied and filled in by detect_project_info
+_DEFAULT_INFO: dict[str, Any] = {
+    "project_name": "",
+    "project_slug": "",
+    "class_name": "",
+    "project_type": "generic",
+    "author": "Gentem User",
+    "email": "",
+    "description": "",
+    "version": "0.1.0",
+    "python_version": "3.10",
+    "python_versions": ("3.10", "3.11", "3.12"),
+    "year": 0,
+    "month": "",
 }
 
+# (template_path, output_path) pairs rendered for every project type
+_MODULE_TEMPLATES: dict[str, tuple[tuple[str, str], ...]] = {
+    "docker": (
+        ("add/docker/Dockerfile.j2", "Dockerfile"),
+        ("add/docker/.dockerignore.j2", ".dockerignore"),
+        ("add/docker/docker-compose.yml.j2", "docker-compose.yml"),
+    ),
+    "docs": (
+        ("add/docs/mkdocs.yml.j2", "mkdocs.yml"),
+        ("add/docs/docs/index.md.j2", "docs/index.md"),
+        ("add/docs/docs/api.md.j2", "docs/api.md"),
+        ("add/docs/docs/getting-started.md.j2", "docs/getting-started.md"),
+    ),
+    "testing": (
+        ("add/testing/conftest.py.j2", "tests/conftest.py"),
+        ("add/testing/test_core.py.j2", "tests/test_core.py"),
+    ),
+    "logging": (("add/logging/logging.yaml.j2", "logging.yaml"),),
+    "database": (
+        ("add/database/alembic.ini.j2", "alembic.ini"),
+        ("add/database/alembic/env.py.j2", "alembic/env.py"),
+        ("add/database/alembic/script.py.mako.j2", "alembic/script.py.mako"),
+    ),
+    "ci": (("add/ci/.github/workflows/ci.yml.j2", ".github/workflows/ci.yml"),),
+    "precommit": (("add/precommit/.pre-commit-config.yaml.j2", ".pre-commit-config.yaml"),),
+    "poetry": (("add/poetry/pyproject.toml.j2", "pyproject.toml"),),
+}
+
+# Extra templates for a specific (module_type, project_type) pair
+_PROJECT_TYPE_TEMPLATES: dict[tuple[str, str], tuple[tuple[str, str], ...]] = {
+    ("testing", "fastapi"): (("add/testing/test_api.py.j2", "tests/test_api.py"),),
+    ("logging", "fastapi"): (("add/logging/app/logging.py.j2", "app/logging.py"),),
+}
+
+# Extra templates used when no project-type specific entry exists
+_DEFAULT_EXTRA_TEMPLATES: dict[str, tuple[tuple[str, str], ...]] = {
+    "logging": (("add/logging/src/logging_config.py.j2", "src/logging_config.py"),),
+}
 
-def detect_project_type(project_path: Path) -> Optional[str]:
-    """Detect the project type from pyproject.toml.
+
+def _read_pyproject(project_path: Path) -> Optional[tuple[str, Optional[dict[str, Any]]]]:
+    """Read and parse pyproject.toml from a project directory.
+
+    Results are cached by path, modification time and size, so repeated
+    lookups for an unchanged file skip both the read and the parse.
 
     Args:
         project_path: Path to the project directory.
 
     Returns:
-        Project type string or None if not detected.
+        Tuple of (content, parsed document or None), or None if there is no
+        readable pyproject.toml.
     """
     pyproject_path = project_path / "pyproject.toml"
+    try:
+        stat = pyproject_path.stat()
+    except OSError:
+        return None
+
+    key = (str(pyproject_path), stat.st_mtime_ns, stat.st_size)
+    cached = _PYPROJECT_CACHE.get(key)
+    if cached is None:
+        try:
+            content = pyproject_path.read_text(encoding="utf-8")
+        except OSError:
+            return None
+        cached = _PYPROJECT_CACHE[key] = (content, _load_pyproject(content))
+
+    return cached
+
+
+def _load_pyproject(content: str) -> Optional[dict[str, Any]]:
+    """Parse pyproject.toml content with tomllib.
 
-    if not pyproject_path.exists():
+    Args:
+        content: The pyproject.toml content.
+
+    Returns:
+        The parsed document, or None if no TOML parser is available or the
+        content is malformed.
+    """
+    if sys.version_info >= (3, 11):
+        import tomllib
+    else:
+        try:
+            import tomli as tomllib  # type: ignore[import-not-found]
+        except ImportError:
+            return None
+
+    try:
+        data: dict[str, Any] = tomllib.loads(content)
+    except tomllib.TOMLDecodeError:
         return None
+    return data
 
-    content = pyproject_path.read_text(encoding="utf-8")
 
-    # Check for FastAPI
-    if 'fastapi' in content.lower():
-        return "fastapi"
+def _fields_from_toml(data: dict[str, Any]) -> dict[str, str]:
+    """Extract project fields from a parsed pyproject.toml.
 
-    # Check for CLI (has [project.scripts] entry points in pyproject.toml)
-    if '[project.scripts]' in content or 'project.scripts' in content:
-        return "cli"
+    Args:
+        data: The parsed pyproject.toml document.
+
+    Returns:
+        Mapping of name/author/email/description/version/python to values.
+    """
+    project = data.get("project", {})
+    poetry = data.get("tool", {}).get("poetry", {})
+    fields: dict[str, str] = {}
+
+    # [project] takes precedence over [tool.poetry]
+    for section in (project, poetry):
+        for key in ("name", "author", "email", "description", "version"):
+            value = section.get(key)
+            if isinstance(value, str) and value:
+                fields.setdefault(key, value)
+
+        authors = section.get("authors")
+        if isinstance(authors, list) and authors:
+            first = authors[0]
+            if isinstance(first, dict):
+                author, email = first.get("name", ""), first.get("email", "")
+            else:
+                # Poetry style: "Name <email>"
+                author, _, email = str(first).partition("<")
+                email = email.rstrip(">")
+            if author.strip():
+                fields.setdefault("author", author.strip())
+            if email.strip():
+                fields.setdefault("email", email.strip())
+
+    python_spec = project.get("requires-python") or poetry.get("dependencies", {}).get("python")
+    if isinstance(python_spec, str):
+        version_match = _VERSION_NUMBER_RE.search(python_spec)
+        if version_match:
+            fields["python"] = version_match.group(0)
+
+    return fields
+
+
+def _fields_from_text(content: str) -> dict[str, str]:
+    """Extract project fields from raw pyproject.toml text.
+
+    Used when no TOML parser is available or the file is not valid TOML.
+
+    Args:
+        content: The pyproject.toml content.
+
+    Returns:
+        Mapping of name/author/email/description/version/python to values.
+    """
+    # Single pass over the file; the first occurrence of each field wins
+    fields: dict[str, str] = {}
+    for match in _PYPROJECT_FIELD_RE.finditer(content):
+        fields.setdefault(match.group("key"), match.group("value"))
+
+    py_match = _PYTHON_VERSION_RE.search(content)
+    if py_match:
+        fields["python"] = py_match.group(1)
+
+    return fields
+
+
+def _detect_project_type(content: str) -> str:
+    """Detect the project type from pyproject.toml content.
+
+    Args:
+        content: The pyproject.toml content.
 
-    # Check for setup.py style console_scripts (legacy)
-    if 'console_scripts' in content:
+    Returns:
+        Project type string.
+    """
+    # Collect markers in one pass; FastAPI takes priority over everything else
+    found: set[Optional[str]] = set()
+    for match in _PROJECT_TYPE_MARKER_RE.finditer(content):
+        if match.lastgroup == "fastapi":
+            return "fastapi"
+        found.add(match.lastgroup)
+
+    # CLI ([project.scripts] entry points, or setup.py style console_scripts)
+    if "cli" in found:
         return "cli"
 
-    # Check for library (has py.requires or similar)
-    if 'py.' in content and 'dependencies' in content:
+    # Library (has py.requires or similar)
+    if "py" in found and "dependencies" in found:
         return "library"
 
     return "generic"
 
 
-def detect_project_info(project_path: Path) -> dict[str, Any]:
-    """Detect project information from existing project files.
+def detect_project_type(project_path: Path) -> Optional[str]:
+    """Detect the project type from pyproject.toml.
 
     Args:
         project_path: Path to the project directory.
 
     Returns:
-        Dictionary with project information.
+        Project type string or None if not detected.
     """
-    project_type = detect_project_type(project_path)
-    pyproject_path = project_path / "pyproject.toml"
-
-    # Defaults
-    info = {
-        "project_name": project_path.name,
-        "project_slug": project_path.name.lower().replace("_", "-"),
-        "class_name": "".join(word.capitalize() for word in project_path.name.split("_")),
-        "project_type": project_type or "generic",
-        "author": "Gentem User",
-        "email": f"user@{project_path.name.lower()}.dev",
-        "description": "",
-        "version": "0.1.0",
-        "python_version": "3.10",
-        "python_versions": ["3.10", "3.11", "3.12"],
-        "year": datetime.now().year,
-        "month": datetime.now().strftime("%B"),
-    }
-
-    if pyproject_path.exists():
-        content = pyproject_path.read_text(encoding="utf-8")
-
-        # Extract project name from [project] or [tool.poetry] section
-        name_match = re.search(r'name\s*=\s*["\']([^"\']+)["\']', content)
-        if name_match:
-            info["project_name"] = name_match.group(1)
-            info["project_slug"] = name_match.group(1).lower().replace("_", "-")
-            info["class_name"] = "".join(
-                word.capitalize() for word in name_match.group(1).split("_")
-            )
+    pyproject = _read_pyproject(project_path)
+    if pyproject is None:
+        return None
 
-        # Extract author
-        author_match = re.search(r'author\s*=\s*["\']([^"\']+)["\']', content)
-        if author_match:
-            info["author"] = author_match.group(1)
+    return _detect_project_type(pyproject[0])
 
-        # Extract email
-        email_match = re.search(r'email\s*=\s*["\']([^"\']+)["\']', content)
-        if email_match:
-            info["email"] = email_match.group(1)
 
-        # Extract description
-        desc_match = re.search(r'description\s*=\s*["\']([^"\']+)["\']', content)
-        if desc_match:
-            info["description"] = desc_match.group(1)
+def detect_project_info(project_path: Path) -> dict[str, Any]:
+    """Detect project information from existing project files.
 
-        # Extract version
-        version_match = re.search(r'version\s*=\s*["\']([^"\']+)["\']', content)
-        if version_match:
-            info["version"] = version_match.group(1)
+    Args:
+        project_path: Path to the project directory.
 
-        # Extract python requirement
-        py_match = re.search(r'python\s*["\']?\^?["\']?\s*["\']?([0-9.]+)["\']?', content)
-        if py_match:
-            info["python_version"] = py_match.group(1)
+    Returns:
+        Dictionary with project information.
+    """
+    # Read pyproject.toml once and share it between type and field detection
+    pyproject = _read_pyproject(project_path)
+    project_type = _detect_project_type(pyproject[0]) if pyproject is not None else None
+    now = datetime.now()
+
+    # Defaults; only the path- and time-derived values differ between calls
+    info = _DEFAULT_INFO.copy()
+    info["project_name"] = project_path.name
+    info["project_slug"] = project_path.name.lower().replace("_", "-")
+    info["class_name"] = project_path.name.replace("_", " ").title().replace(" ", "")
+    info["project_type"] = project_type or "generic"
+    info["email"] = f"user@{project_path.name.lower()}.dev"
+    info["year"] = now.year
+    info["month"] = _MONTHS[now.month - 1]
+
+    if pyproject is not None:
+        content, data = pyproject
+        fields = _fields_from_toml(data) if data is not None else _fields_from_text(content)
+
+        # Project name from [project] or [tool.poetry] section
+        if "name" in fields:
+            name = fields["name"]
+            info["project_name"] = name
+            info["project_slug"] = name.lower().replace("_", "-")
+            info["class_name"] = name.replace("_", " ").title().replace(" ", "")
+
+        for key in ("author", "email", "description", "version"):
+            if key in fields:
+                info[key] = fields[key]
+
+        if "python" in fields:
+            info["python_version"] = fields["python"]
 
     return info
 
 
-def get_module_templates(module_type: str, project_type: str) -> list[tuple[str, str]]:
-    """Get list of template files to render for a module.
+@functools.cache
+def get_module_templates(module_type: str, project_type: str) -> tuple[tuple[str, str], ...]:
+    """Get the template files to render for a module.
+
+    Results are cached, so the returned tuple is shared between callers.
 
     Args:
         module_type: Type of module to add.
         project_type: Type of project (fastapi, cli, library, generic).
 
     Returns:
-        List of (template_path, output_path) tuples.
+        Tuple of (template_path, output_path) tuples.
     """
-    templates = []
+    extra = _PROJECT_TYPE_TEMPLATES.get(
+        (module_type, project_type),
+        _DEFAULT_EXTRA_TEMPLATES.get(module_type, ()),
+    )
+    return (*_MODULE_TEMPLATES.get(module_type, ()), *extra)
 
-    if module_type == "docker":
-        templates = [
-            ("add/docker/Dockerfile.j2", "Dockerfile"),
-            ("add/docker/.dockerignore.j2", ".dockerignore"),
-            ("add/docker/docker-compose.yml.j2", "docker-compose.yml"),
-        ]
 
-    elif module_type == "docs":
-        templates = [
-            ("add/docs/mkdocs.yml.j2", "mkdocs.yml"),
-            ("add/docs/docs/index.md.j2", "docs/index.md"),
-            ("add/docs/docs/api.md.j2", "docs/api.md"),
-            ("add/docs/docs/getting-started.md.j2", "docs/getting-started.md"),
-        ]
+def _write_template(
+    engine: "TemplateEngine",
+    template_path: str,
+    context: dict[str, Any],
+    output_path: Path,
+    force: bool,
+) -> Optional[str]:
+    """Render a template and write it to output_path.
 
-    elif module_type == "testing":
-        templates = [
-            ("add/testing/conftest.py.j2", "tests/conftest.py"),
-            ("add/testing/test_core.py.j2", "tests/test_core.py"),
-        ]
-        if project_type == "fastapi":
-            templates.append(("add/testing/test_api.py.j2", "tests/test_api.py"))
+    Args:
+        engine: Template engine to render with.
+        template_path: Path to the template relative to the template directory.
+        context: Variables to pass to the template.
+        output_path: Path to write the rendered file.
+        force: Overwrite the file if it already exists.
 
-    elif module_type == "logging":
-        templates = [
-            ("add/logging/logging.yaml.j2", "logging.yaml"),
-        ]
-        if project_type == "fastapi":
-            templates.append(("add/logging/app/logging.py.j2", "app/logging.py"))
-        elif project_type == "cli":
-            templates.append(("add/logging/src/logging_config.py.j2", "src/logging_config.py"))
-        else:
-            templates.append(("add/logging/src/logging_config.py.j2", "src/logging_config.py"))
+    Returns:
+        "Created" or "Updated", or None if the file exists and was skipped.
+    """
+    # Check if file exists and we're not forcing
+    exists_before = output_path.exists()
+    if exists_before and not force:
+        return None
 
-    elif module_type == "database":
-        templates = [
-            ("add/database/alembic.ini.j2", "alembic.ini"),
-            ("add/database/alembic/env.py.j2", "alembic/env.py"),
-            ("add/database/alembic/script.py.mako.j2", "alembic/script.py.mako"),
-        ]
+    content = engine.render_template(template_path, context)
 
-    elif module_type == "ci":
-        templates = [
-            ("add/ci/.github/workflows/ci.yml.j2", ".github/workflows/ci.yml"),
-        ]
+    # Only create the directory once there is something to put in it, so a
+    # failed render leaves no empty directories behind
+    output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    elif module_type == "precommit":
-        templates = [
-            ("add/precommit/.pre-commit-config.yaml.j2", ".pre-commit-config.yaml"),
-        ]
+    # Write UTF-8 bytes so line endings match render_file on every platform;
+    # "x" refuses to clobber a file created since the check
+    with open(output_path, "wb" if force else "xb") as f:
+        f.write(content.encode("utf-8"))
+
+    return "Updated" if exists_before else "Created"
 
-    elif module_type == "poetry":
-        templates = [
-            ("add/poetry/pyproject.toml.j2", "pyproject.toml"),
-        ]
 
-    return templates
+def _emit_banner(
+    module_type: str,
+    project_name: str,
+    context: dict[str, Any],
+    verbose: bool,
+) -> None:
+    """Announce the module being added.
+
+    The Rich panel is only drawn in verbose mode; otherwise plain lines are
+    echoed so the panel machinery is never loaded.
+
+    Args:
+        module_type: Type of module being added.
+        project_name: Name of the project directory.
+        context: Detected project information.
+        verbose: Whether verbose output was requested.
+    """
+    if verbose:
+        from rich import print
+        from rich.panel import Panel
+
+        print(
+            Panel(
+                f"[bold]Adding {module_type} module to:[/] [cyan]{project_name}[/]\n"
+                f"[dim]Project type:[/] {context['project_type']}\n"
+                f"[dim]Version:[/] {context['version']}",
+                title="Gentem (add)",
+                expand=False,
+            )
+        )
+    else:
+        typer.echo(f"Adding {module_type} module to: {project_name}")
+        typer.echo(f"Project type: {context['project_type']}")
+        typer.echo(f"Version: {context['version']}")
 
 
 def add_module(
@@ -209,6 +427,7 @@ def add_module(
     dry_run: bool = False,
     verbose: bool = False,
     force: bool = False,
+    engine: Optional["TemplateEngine"] = None,
 ) -> None:
     """Add a module to an existing project.
 
@@ -218,20 +437,27 @@ def add_module(
         dry_run: Preview without creating files.
         verbose: Show verbose output.
         force: Overwrite existing files without prompting.
+        engine: Template engine to render with. Defaults to the shared engine
+            from get_template_engine(), which is only built on first use.
     """
     # Validate inputs
     try:
         module_type = validate_module_type(module_type)
-        project_path = validate_project_path(project_path)
+        project_dir = validate_project_path(project_path)
     except ValidationError as e:
-        print(f"[red]Error: {e}[/]")
+        # Plain stderr keeps Rich out of the error path
+        sys.stderr.write(f"Error: {e}\n")
         raise SystemExit(1) from e
 
+    # Deferred so failed validation never pays for the Rich import; Jinja2 is
+    # only loaded below, once a real (non dry-run) render is needed
+    from rich import print
+
     # Detect project information
-    context = detect_project_info(project_path)
+    context = detect_project_info(project_dir)
 
     if verbose:
-        print(f"Project path: {project_path}")
+        print(f"Project path: {project_dir}")
         print(f"Project type: {context['project_type']}")
         print(f"Project name: {context['project_name']}")
         print(f"Module type: {module_type}")
@@ -245,21 +471,13 @@ def add_module(
         raise SystemExit(1)
 
     # Show summary
-    print(
-        Panel(
-            f"[bold]Adding {module_type} module to:[/] [cyan]{project_path.name}[/]\n"
-            f"[dim]Project type:[/] {context['project_type']}\n"
-            f"[dim]Version:[/] {context['version']}",
-            title="Gentem (add)",
-            expand=False,
-        )
-    )
+    _emit_banner(module_type, project_dir.name, context, verbose)
 
     if dry_run:
         print("[yellow]DRY RUN - No files will be created[/]")
         print(f"\nFiles that would be created/modified:")
         for _, output_file in template_files:
-            output_path = project_path / output_file
+            output_path = project_dir / output_file
             if output_path.exists():
                 print(f"  - [yellow]{output_file}[/] (update)")
             else:
@@ -267,29 +485,37 @@ def add_module(
         return
 
     # Initialize template engine
-    engine = TemplateEngine()
+    if engine is None:
+        from gentem.template_engine import get_template_engine
+
+        engine = get_template_engine()
 
     # Render and write files
     try:
-        for template_path, output_file in template_files:
-            output_path = project_path / output_file
-
-            # Check if file exists and we're not forcing
-            if output_path.exists() and not force:
+        # Files are independent, so render and write them concurrently
+        def write(template_file: tuple[str, str]) -> Optional[str]:
+            template_path, output_file = template_file
+            output_path = project_dir / output_file
+            return _write_template(engine, template_path, context, output_path, force)
+
+        with ThreadPoolExecutor(max_workers=min(8, len(template_files))) as executor:
+            futures = [executor.submit(write, template_file) for template_file in template_files]
+
+        # Report every file in template order, including any that failed, so
+        # files already written by other workers are never left unmentioned
+        errors = []
+        for (_, output_file), future in zip(template_files, futures):
+            error = future.exception()
+            if error is not None:
+                errors.append(error)
+                print(f"  [red]✗[/] {output_file}: {error}")
+            elif future.result() is None:
                 print(f"  [yellow]?[/] {output_file} (exists, use --force to overwrite)")
-                continue
-
-            # Render content
-            content = engine.render_template(template_path, context)
-
-            # Ensure parent directory exists
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Write the file
-            output_path.write_text(content, encoding="utf-8")
+            else:
+                print(f"  [green]✓[/] {future.result()}: {output_file}")
 
-            action = "Updated" if output_path.exists() else "Created"
-            print(f"  [green]✓[/] {action}: {output_file}")
+        if errors:
+            raise errors[0]
 
         print(f"\n[green]✓ {module_type} module added successfully![/]")
 
@@ -321,6 +547,9 @@ def add_modules(
         verbose: Show verbose output.
         force: Overwrite existing files without prompting.
     """
+    # Each add_module call renders with the shared get_template_engine()
+    # instance, so templates compiled for one module are reused by the next
+    # and Jinja2 is never loaded for dry runs or invalid module names
     for module_type in module_types:
         add_module(
             module_type=module_type,
@@ -1,6 +1,9 @@
 """Template engine for Gentem using Jinja2."""
 
+import functools
 import os
+import shutil
+import uuid
 from pathlib import Path
 from typing import Any, Optional
 
@@ -9,10 +12,15 @@ from jinja2 import (
     FileSystemLoader,
     TemplateSyntaxError,
     UndefinedError,
+    select_autoescape,
 )
 from jinja2.environment import Template
 from rich.tree import Tree
 
+# Bundled templates directory, computed once at import.
+# __file__ is at src/gentem/template_engine.py, so this is src/gentem/templates
+_DEFAULT_TEMPLATE_DIR = Path(__file__).parent / "templates"
+
 
 class TemplateEngine:
     """Jinja2 template engine for generating project files."""
@@ -28,18 +36,23 @@ class TemplateEngine:
         if template_dir:
             self.template_dir = Path(template_dir)
         else:
-            # Find the package directory (gentem/)
-            # __file__ is at src/gentem/template_engine.py
-            # parent is src/gentem, and templates is at src/gentem/templates
-            self.template_dir = Path(__file__).parent / "templates"
+            self.template_dir = _DEFAULT_TEMPLATE_DIR
 
         self.env = Environment(
             loader=FileSystemLoader(str(self.template_dir)),
-            autoescape=True,
+            # Generated files are source/config, not HTML; only escape markup templates
+            autoescape=select_autoescape(enabled_extensions=("html", "xml"), default=False),
             trim_blocks=True,
             lstrip_blocks=True,
+            # Templates don't change during a run, so keep every compiled
+            # template and skip the mtime check on each lookup
+            cache_size=-1,
+            auto_reload=False,
         )
 
+        # Sorted template paths, filled in on the first list_templates() call
+        self._templates: Optional[tuple[str, ...]] = None
+
     def get_template(self, template_path: str) -> Template:
         """Get a template by path.
 
@@ -94,13 +107,25 @@ class TemplateEngine:
             context: Variables to pass to the template.
             output_path: Path to write the rendered file.
         """
-        content = self.render_template(template_path, context)
+        template = self.get_template(template_path)
 
         # Ensure parent directory exists
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Write the file
-        output_path.write_text(content, encoding="utf-8")
+        # Stream the rendered chunks to disk as UTF-8 bytes instead of building
+        # the whole file in memory first. They go to a sibling temp file that
+        # only replaces output_path once rendering succeeds, so a failed render
+        # never truncates or removes an existing file
+        tmp_path = output_path.with_name(f".{output_path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            with open(tmp_path, "xb") as f:
+                template.stream(**context).dump(f, encoding="utf-8")
+            if output_path.exists():
+                shutil.copymode(output_path, tmp_path)
+            os.replace(tmp_path, output_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
 
     def list_templates(self, subdir: Optional[str] = None) -> list[str]:
         """List all templates in a subdirectory.
@@ -111,21 +136,22 @@ class TemplateEngine:
         Returns:
             List of template paths.
         """
-        search_dir = self.template_dir
-        if subdir:
-            search_dir = search_dir / subdir
-
-        if not search_dir.exists():
-            return []
-
-        templates = []
-        for root, _, files in os.walk(search_dir):
-            for file in files:
-                if file.endswith((".j2", ".jinja2")):
-                    rel_path = Path(root).relative_to(self.template_dir)
-                    templates.append(str(rel_path / file))
-
-        return sorted(templates)
+        if self._templates is None:
+            # Walk the template directory once and reuse the result
+            templates = []
+            for root, _, files in os.walk(self.template_dir):
+                for file in files:
+                    if file.endswith((".j2", ".jinja2")):
+                        rel_path = Path(root).relative_to(self.template_dir)
+                        templates.append(str(rel_path / file))
+            self._templates = tuple(sorted(templates))
+
+        # "." (or "./") means the template directory itself, as with os.walk
+        if not subdir or Path(subdir) == Path("."):
+            return list(self._templates)
+
+        prefix = str(Path(subdir)) + os.sep
+        return [t for t in self._templates if t.startswith(prefix)]
 
     def preview_tree(
         self,
@@ -177,13 +203,7 @@ class TemplateEngine:
         return tree
 
 
-# Global template engine instance
-_engine: Optional[TemplateEngine] = None
-
-
+@functools.lru_cache(maxsize=1)
 def get_template_engine() -> TemplateEngine:
     """Get the global template engine instance."""
-    global _engine
-    if _engine is None:
-        _engine = TemplateEngine()
-    return _engine
+    return TemplateEngine()
@@ -1,13 +1,18 @@
 """Utilities package for Gentem."""
 
-from gentem.utils.validators import (
-    validate_license_type,
-    validate_project_name,
-    validate_python_identifier,
-)
+from typing import Any
 
 __all__ = [
     "validate_project_name",
     "validate_python_identifier",
     "validate_license_type",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Load validators on first access instead of at package import."""
+    if name in __all__:
+        from gentem.utils import validators
+
+        return getattr(validators, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,9 +1,27 @@
 """Input validators for Gentem."""
 
-import re
+import keyword
+import os
 from pathlib import Path
 from typing import Optional
 
+_VALID_LICENSES = frozenset({"mit", "apache", "gpl", "bsd", "none", ""})
+_VALID_PROJECT_TYPES = frozenset({"library", "cli", "script"})
+_VALID_DB_TYPES = frozenset({"asyncpg", "sqlite", "postgres", "postgresql"})
+_VALID_MODULES = frozenset(
+    {
+        "docker",
+        "docs",
+        "testing",
+        "logging",
+        "database",
+        "ci",
+        "precommit",
+        "poetry",
+    }
+)
+_PROJECT_MARKERS = frozenset({"pyproject.toml", "setup.py", ".gentemrc"})
+
 
 class ValidationError(Exception):
     """Raised when validation fails."""
@@ -13,8 +31,8 @@ class ValidationError(Exception):
 
 def validate_python_identifier(name: str) -> bool:
     """Check if the name is a valid Python identifier."""
-    pattern = r"^[a-zA-Z_][a-zA-Z0-9_]*$"
-    return bool(re.match(pattern, name))
+    # ASCII-only, matching ``^[a-zA-Z_][a-zA-Z0-9_]*$`` without the regex engine
+    return name.isascii() and name.isidentifier()
 
 
 def validate_project_name(name: str) -> str:
@@ -38,46 +56,9 @@ def validate_project_name(name: str) -> str:
             "Use only letters, numbers, and underscores, starting with a letter or underscore."
         )
 
-    # Check for Python reserved words
-    reserved_words = {
-        "and",
-        "as",
-        "assert",
-        "async",
-        "await",
-        "break",
-        "class",
-        "continue",
-        "def",
-        "del",
-        "elif",
-        "else",
-        "except",
-        "finally",
-        "for",
-        "from",
-        "global",
-        "if",
-        "import",
-        "in",
-        "is",
-        "lambda",
-        "nonlocal",
-        "not",
-        "or",
-        "pass",
-        "raise",
-        "return",
-        "try",
-        "while",
-        "with",
-        "yield",
-        "True",
-        "False",
-        "None",
-    }
-
-    if name.lower() in reserved_words:
+    # Check for Python reserved words (case-insensitively, but True/False/None
+    # are only keywords when capitalized)
+    if keyword.iskeyword(name) or keyword.iskeyword(name.lower()):
         raise ValidationError(
             f"'{name}' is a Python reserved word and cannot be used as a project name."
         )
@@ -97,13 +78,11 @@ def validate_license_type(license_type: str) -> str:
     Raises:
         ValidationError: If the license type is invalid.
     """
-    valid_licenses = {"mit", "apache", "gpl", "bsd", "none", ""}
-
     normalized = license_type.lower().strip()
-    if normalized not in valid_licenses:
+    if normalized not in _VALID_LICENSES:
         raise ValidationError(
             f"Invalid license type: '{license_type}'. "
-            f"Valid options are: {', '.join(sorted(valid_licenses))}"
+            f"Valid options are: {', '.join(sorted(_VALID_LICENSES))}"
         )
 
     return normalized
@@ -121,13 +100,11 @@ def validate_project_type(project_type: str) -> str:
     Raises:
         ValidationError: If the project type is invalid.
     """
-    valid_types = {"library", "cli", "script"}
-
     normalized = project_type.lower().strip()
-    if normalized not in valid_types:
+    if normalized not in _VALID_PROJECT_TYPES:
         raise ValidationError(
             f"Invalid project type: '{project_type}'. "
-            f"Valid options are: {', '.join(sorted(valid_types))}"
+            f"Valid options are: {', '.join(sorted(_VALID_PROJECT_TYPES))}"
         )
 
     return normalized
@@ -148,13 +125,11 @@ def validate_db_type(db_type: str) -> Optional[str]:
     if not db_type:
         return None
 
-    valid_db_types = {"asyncpg", "sqlite", "postgres", "postgresql"}
-
     normalized = db_type.lower().strip()
-    if normalized not in valid_db_types:
+    if normalized not in _VALID_DB_TYPES:
         raise ValidationError(
             f"Invalid database type: '{db_type}'. "
-            f"Valid options are: {', '.join(sorted(valid_db_types))} or empty for none."
+            f"Valid options are: {', '.join(sorted(_VALID_DB_TYPES))} or empty for none."
         )
 
     # Normalize postgres/postgresql to asyncpg for now
@@ -177,15 +152,13 @@ def validate_output_path(path: str, dry_run: bool = False) -> Path:
     Raises:
         ValidationError: If the path is invalid.
     """
-    output_path = Path(path)
-
-    if output_path.exists() and not dry_run:
+    if not dry_run and os.path.exists(path):
         raise ValidationError(
-            f"Directory '{output_path}' already exists. "
+            f"Directory '{Path(path)}' already exists. "
             "Please choose a different project name or remove the existing directory."
         )
 
-    return output_path
+    return Path(path)
 
 
 def validate_module_type(module_type: str) -> str:
@@ -200,22 +173,15 @@ def validate_module_type(module_type: str) -> str:
     Raises:
         ValidationError: If the module type is invalid.
     """
-    valid_modules = {
-        "docker",
-        "docs",
-        "testing",
-        "logging",
-        "database",
-        "ci",
-        "precommit",
-        "poetry",
-    }
+    # Fast path for already-normalized input, e.g. from shell completion
+    if module_type in _VALID_MODULES:
+        return module_type
 
     normalized = module_type.lower().strip()
-    if normalized not in valid_modules:
+    if normalized not in _VALID_MODULES:
         raise ValidationError(
             f"Invalid module type: '{module_type}'. "
-            f"Valid options are: {', '.join(sorted(valid_modules))}"
+            f"Valid options are: {', '.join(sorted(_VALID_MODULES))}"
         )
 
     return normalized
@@ -233,23 +199,24 @@ def validate_project_path(path: str) -> Path:
     Raises:
         ValidationError: If the path is invalid.
     """
-    project_path = Path(path)
-
-    if not project_path.exists():
+    if not os.path.exists(path):
         raise ValidationError(f"Project path does not exist: '{path}'")
 
-    if not project_path.is_dir():
+    if not os.path.isdir(path):
         raise ValidationError(f"Project path is not a directory: '{path}'")
 
     # Check for project markers (pyproject.toml or setup.py or .gentemrc)
-    has_pyproject = (project_path / "pyproject.toml").exists()
-    has_setup = (project_path / "setup.py").exists()
-    has_gentemrc = (project_path / ".gentemrc").exists()
-
-    if not (has_pyproject or has_setup or has_gentemrc):
+    # with a single directory listing rather than one stat per marker
+    try:
+        with os.scandir(path) as entries:
+            has_marker = any(entry.name in _PROJECT_MARKERS for entry in entries)
+    except OSError:
+        has_marker = False
+
+    if not has_marker:
         raise ValidationError(
             f"'{path}' does not appear to be a valid project directory. "
             "Expected pyproject.toml, setup.py, or .gentemrc."
         )
 
-    return project_path
+    return Path(path)
@@ -0,0 +1,8 @@
+"""Shared pytest configuration for Gentem tests."""
+
+import os
+import tempfile
+
+# Keep tmp_path directories on a memory-backed filesystem where one is available
+if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+    tempfile.tempdir = "/dev/shm"
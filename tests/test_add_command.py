@@ -1,15 +1,16 @@
 """Tests for the gentem add command module."""
 
-import tempfile
 from pathlib import Path
 
 import pytest
 
 from gentem.commands.add import (
+    add_module,
     detect_project_info,
     detect_project_type,
     get_module_templates,
 )
+from gentem.template_engine import TemplateEngine
 from gentem.utils.validators import (
     ValidationError,
     validate_module_type,
@@ -20,44 +21,21 @@ from gentem.utils.validators import (
 class TestValidateModuleType:
     """Tests for validate_module_type function."""
 
-    def test_valid_module_docker(self):
-        """Test that 'docker' is a valid module type."""
-        assert validate_module_type("docker") == "docker"
-
-    def test_valid_module_docs(self):
-        """Test that 'docs' is a valid module type."""
-        assert validate_module_type("docs") == "docs"
-
-    def test_valid_module_testing(self):
-        """Test that 'testing' is a valid module type."""
-        assert validate_module_type("testing") == "testing"
-
-    def test_valid_module_logging(self):
-        """Test that 'logging' is a valid module type."""
-        assert validate_module_type("logging") == "logging"
-
-    def test_valid_module_database(self):
-        """Test that 'database' is a valid module type."""
-        assert validate_module_type("database") == "database"
-
-    def test_valid_module_ci(self):
-        """Test that 'ci' is a valid module type."""
-        assert validate_module_type("ci") == "ci"
-
-    def test_valid_module_precommit(self):
-        """Test that 'precommit' is a valid module type."""
-        assert validate_module_type("precommit") == "precommit"
-
-    def test_valid_module_poetry(self):
-        """Test that 'poetry' is a valid module type."""
-        assert validate_module_type("poetry") == "poetry"
-
-    def test_case_insensitive(self):
+    @pytest.mark.parametrize(
+        "module",
+        ["docker", "docs", "testing", "logging", "database", "ci", "precommit", "poetry"],
+    )
+    def test_valid_modules(self, module):
+        """Test that each supported module type is valid."""
+        assert validate_module_type(module) == module
+
+    @pytest.mark.parametrize(
+        "module,expected",
+        [("DOCKER", "docker"), ("Docs", "docs"), ("TESTING", "testing"), ("CI", "ci")],
+    )
+    def test_case_insensitive(self, module, expected):
         """Test that module type is case insensitive."""
-        assert validate_module_type("DOCKER") == "docker"
-        assert validate_module_type("Docs") == "docs"
-        assert validate_module_type("TESTING") == "testing"
-        assert validate_module_type("CI") == "ci"
+        assert validate_module_type(module) == expected
 
     def test_invalid_module(self):
         """Test that invalid module type raises ValidationError."""
@@ -74,14 +52,21 @@ class TestValidateModuleType:
 class TestValidateProjectPath:
     """Tests for validate_project_path function."""
 
-    def test_valid_path_with_pyproject(self):
+    def test_valid_path_with_pyproject(self, tmp_path):
         """Test validation with a valid pyproject.toml."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_path = Path(tmpdir)
-            (project_path / "pyproject.toml").write_text("[project]\nname = 'test'")
+        project_path = tmp_path
+        (project_path / "pyproject.toml").write_text("[project]\nname = 'test'")
+
+        result = validate_project_path(str(project_path))
+        assert result == project_path
 
-            result = validate_project_path(str(project_path))
-            assert result == project_path
+    def test_valid_path_with_gentemrc(self, tmp_path):
+        """Test validation with only a .gentemrc marker."""
+        project_path = tmp_path
+        (project_path / ".gentemrc").write_text("")
+
+        result = validate_project_path(str(project_path))
+        assert result == project_path
 
     def test_nonexistent_path(self):
         """Test that nonexistent path raises ValidationError."""
@@ -89,116 +74,201 @@ class TestValidateProjectPath:
             validate_project_path("/nonexistent/path")
         assert "does not exist" in str(exc_info.value)
 
-    def test_file_instead_of_directory(self):
+    def test_file_instead_of_directory(self, tmp_path):
         """Test that a file path raises ValidationError."""
-        with tempfile.NamedTemporaryFile() as tmpfile:
-            with pytest.raises(ValidationError) as exc_info:
-                validate_project_path(tmpfile.name)
-            assert "not a directory" in str(exc_info.value)
-
-    def test_directory_without_project_file(self):
-        """Test that directory without project file raises ValidationError."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            with pytest.raises(ValidationError) as exc_info:
-                validate_project_path(tmpdir)
-            assert "does not appear to be a valid project" in str(exc_info.value)
+        file_path = tmp_path / "f"
+        file_path.write_bytes(b"")
 
+        with pytest.raises(ValidationError) as exc_info:
+            validate_project_path(str(file_path))
+        assert "not a directory" in str(exc_info.value)
 
-class TestDetectProjectType:
-    """Tests for detect_project_type function."""
-
-    def test_detect_fastapi(self):
-        """Test FastAPI project detection."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_path = Path(tmpdir)
-            (project_path / "pyproject.toml").write_text("[project]\nname = 'test'\ndependencies = ['fastapi']")
+    def test_directory_without_project_file(self, tmp_path):
+        """Test that directory without project file raises ValidationError."""
+        with pytest.raises(ValidationError) as exc_info:
+            validate_project_path(str(tmp_path))
+        assert "does not appear to be a valid project" in str(exc_info.value)
 
-            result = detect_project_type(project_path)
-            assert result == "fastapi"
 
-    def test_detect_cli_project_scripts(self):
-        """Test CLI project detection with [project.scripts]."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_path = Path(tmpdir)
-            content = """
+# pyproject.toml variants shared by the read-only detection tests
+PYPROJECT_VARIANTS = {
+    "fastapi": "[project]\nname = 'test'\ndependencies = ['fastapi']",
+    "cli_scripts": """
 [project]
 name = 'test-cli'
 [project.scripts]
 test-cli = "test_cli.main:main"
-"""
-            (project_path / "pyproject.toml").write_text(content)
-
-            result = detect_project_type(project_path)
-            assert result == "cli"
-
-    def test_detect_cli_console_scripts(self):
-        """Test CLI project detection with console_scripts (setup.py style)."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_path = Path(tmpdir)
-            content = """
+""",
+    # The implementation also checks for console_scripts
+    "cli_console_scripts": """
 [project]
 name = 'test-cli'
 
 [project.scripts]
 test-cli = "test_cli.main:main"
-"""
-            # The implementation also checks for console_scripts
-            content_with_console = content + "\n[tool.setup_scripts]\nconsole_scripts = ['test-cli']"
-            (project_path / "pyproject.toml").write_text(content_with_console)
-
-            result = detect_project_type(project_path)
-            assert result == "cli"
 
-    def test_detect_library(self):
-        """Test library project detection."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_path = Path(tmpdir)
-            content = """
+[tool.setup_scripts]
+console_scripts = ['test-cli']
+""",
+    "library": """
 [project]
 name = 'test'
 requires-python = '>=3.9'
-"""
-            (project_path / "pyproject.toml").write_text(content)
-
-            result = detect_project_type(project_path)
-            assert result == "generic"
-
+""",
+    "fastapi_after_cli": """
+[project.scripts]
+api = "api.main:run"
 
-class TestDetectProjectInfo:
-    """Tests for detect_project_info function."""
+[project]
+dependencies = ['FastAPI>=0.100']
+""",
+    "library_with_dependencies": """
+[project]
+name = 'test'
+dependencies = ['numpy']
 
-    def test_detect_project_info(self):
-        """Test that project info is detected from pyproject.toml."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_path = Path(tmpdir)
-            content = """
+[tool.setuptools]
+py.typed = true
+""",
+    "full_info": """
 [project]
 name = 'my-test-project'
 version = '1.2.3'
 author = 'Test Author'
 description = 'A test project'
-"""
-            (project_path / "pyproject.toml").write_text(content)
+""",
+    "minimal": "[project]\nname = 'test'",
+    "repeated_fields": """
+[project]
+name = 'first_project'
+email = 'dev@example.com'
+
+[tool.other]
+name = 'second_project'
+""",
+    "pep621_authors": """
+[project]
+name = "my_lib"
+requires-python = ">=3.11"
+authors = [{name = "Jane Doe", email = "jane@example.com"}]
+""",
+    "poetry": """
+[tool.poetry]
+name = "poetry_app"
+version = "2.0.0"
+authors = ["John Smith <john@example.com>"]
+
+[tool.poetry.dependencies]
+python = "^3.12"
+""",
+    "invalid_toml": "[project\nname = 'broken'\nversion = '0.0.1'\n",
+}
+
+
+@pytest.fixture(scope="session")
+def projects(tmp_path_factory):
+    """Write every pyproject.toml variant once and map its name to the project path."""
+    root = tmp_path_factory.mktemp("projects")
+    paths = {}
+    for name, content in PYPROJECT_VARIANTS.items():
+        project_path = root / name
+        project_path.mkdir()
+        (project_path / "pyproject.toml").write_text(content)
+        paths[name] = project_path
+    return paths
+
+
+class TestDetectProjectType:
+    """Tests for detect_project_type function."""
+
+    def test_detect_fastapi(self, projects):
+        """Test FastAPI project detection."""
+        assert detect_project_type(projects["fastapi"]) == "fastapi"
+
+    def test_detect_cli_project_scripts(self, projects):
+        """Test CLI project detection with [project.scripts]."""
+        assert detect_project_type(projects["cli_scripts"]) == "cli"
+
+    def test_detect_cli_console_scripts(self, projects):
+        """Test CLI project detection with console_scripts (setup.py style)."""
+        assert detect_project_type(projects["cli_console_scripts"]) == "cli"
 
-            info = detect_project_info(project_path)
+    def test_detect_library(self, projects):
+        """Test library project detection."""
+        assert detect_project_type(projects["library"]) == "generic"
+
+    def test_detect_fastapi_takes_priority(self, projects):
+        """Test that FastAPI wins even when it appears after CLI markers."""
+        assert detect_project_type(projects["fastapi_after_cli"]) == "fastapi"
+
+    def test_detect_library_with_dependencies(self, projects):
+        """Test library detection from py. markers and dependencies."""
+        assert detect_project_type(projects["library_with_dependencies"]) == "library"
+
+
+class TestDetectProjectInfo:
+    """Tests for detect_project_info function."""
+
+    def test_detect_project_info(self, projects):
+        """Test that project info is detected from pyproject.toml."""
+        info = detect_project_info(projects["full_info"])
 
-            assert info["project_name"] == "my-test-project"
-            assert info["project_slug"] == "my-test-project"
-            assert info["version"] == "1.2.3"
-            assert info["author"] == "Test Author"
-            assert info["description"] == "A test project"
+        assert info["project_name"] == "my-test-project"
+        assert info["project_slug"] == "my-test-project"
+        assert info["version"] == "1.2.3"
+        assert info["author"] == "Test Author"
+        assert info["description"] == "A test project"
 
-    def test_detect_project_info_defaults(self):
+    def test_detect_project_info_defaults(self, projects):
         """Test that defaults are used when info not found."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_path = Path(tmpdir)
-            (project_path / "pyproject.toml").write_text("[project]\nname = 'test'")
+        info = detect_project_info(projects["minimal"])
+
+        assert info["project_name"] == "test"
+        assert info["version"] == "0.1.0"
+        assert info["author"] == "Gentem User"
+
+    def test_detect_project_info_first_match_wins(self, projects):
+        """Test that the first occurrence of each field is used."""
+        info = detect_project_info(projects["repeated_fields"])
+
+        assert info["project_name"] == "first_project"
+        assert info["class_name"] == "FirstProject"
+        assert info["email"] == "dev@example.com"
 
-            info = detect_project_info(project_path)
+    def test_detect_project_info_pep621_authors(self, projects):
+        """Test author, email and Python version from PEP 621 metadata."""
+        info = detect_project_info(projects["pep621_authors"])
 
-            assert info["project_name"] == "test"
-            assert info["version"] == "0.1.0"
-            assert info["author"] == "Gentem User"
+        assert info["author"] == "Jane Doe"
+        assert info["email"] == "jane@example.com"
+        assert info["python_version"] == "3.11"
+
+    def test_detect_project_info_poetry(self, projects):
+        """Test project info from a [tool.poetry] section."""
+        info = detect_project_info(projects["poetry"])
+
+        assert info["project_name"] == "poetry_app"
+        assert info["version"] == "2.0.0"
+        assert info["author"] == "John Smith"
+        assert info["email"] == "john@example.com"
+        assert info["python_version"] == "3.12"
+
+    def test_detect_project_info_invalid_toml(self, projects):
+        """Test that malformed TOML falls back to text extraction."""
+        info = detect_project_info(projects["invalid_toml"])
+
+        assert info["project_name"] == "broken"
+        assert info["version"] == "0.0.1"
+
+    def test_detect_project_info_sees_file_changes(self, tmp_path):
+        """Test that cached pyproject.toml data is refreshed when the file changes."""
+        # Rewrites its pyproject.toml, so it can't use the shared projects
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text("[project]\nname = 'test'\nversion = '1.0'\n")
+        assert detect_project_info(tmp_path)["version"] == "1.0"
+
+        pyproject.write_text("[project]\nname = 'test'\nversion = '1.0.1'\n")
+        assert detect_project_info(tmp_path)["version"] == "1.0.1"
 
 
 class TestGetModuleTemplates:
@@ -209,27 +279,27 @@ class TestGetModuleTemplates:
         templates = get_module_templates("docker", "generic")
 
         assert len(templates) == 3
-        template_paths = [t[0] for t in templates]
-        assert any("Dockerfile" in p for p in template_paths)
-        assert any("docker-compose" in p for p in template_paths)
+        names = {Path(output).name for _, output in templates}
+        assert "Dockerfile" in names
+        assert "docker-compose.yml" in names
 
     def test_docs_templates(self):
         """Test Docs module templates."""
         templates = get_module_templates("docs", "generic")
 
         assert len(templates) == 4
-        template_paths = [t[0] for t in templates]
-        assert any("mkdocs.yml" in p for p in template_paths)
-        assert any("index.md" in p for p in template_paths)
+        names = {Path(output).name for _, output in templates}
+        assert "mkdocs.yml" in names
+        assert "index.md" in names
 
     def test_testing_templates(self):
         """Test Testing module templates."""
         templates = get_module_templates("testing", "generic")
 
         assert len(templates) == 2
-        template_paths = [t[0] for t in templates]
-        assert any("conftest.py" in p for p in template_paths)
-        assert any("test_core.py" in p for p in template_paths)
+        names = {Path(output).name for _, output in templates}
+        assert "conftest.py" in names
+        assert "test_core.py" in names
 
     def test_testing_templates_fastapi(self):
         """Test Testing module templates for FastAPI."""
@@ -237,16 +307,16 @@ class TestGetModuleTemplates:
 
         # Should include test_api.py for FastAPI
         assert len(templates) == 3
-        template_paths = [t[0] for t in templates]
-        assert any("test_api.py" in p for p in template_paths)
+        names = {Path(output).name for _, output in templates}
+        assert "test_api.py" in names
 
     def test_logging_templates(self):
         """Test Logging module templates."""
         templates = get_module_templates("logging", "generic")
 
         assert len(templates) == 2
-        template_paths = [t[0] for t in templates]
-        assert any("logging.yaml" in p for p in template_paths)
+        names = {Path(output).name for _, output in templates}
+        assert "logging.yaml" in names
 
     def test_logging_templates_fastapi(self):
         """Test Logging module templates for FastAPI."""
@@ -271,9 +341,9 @@ class TestGetModuleTemplates:
         templates = get_module_templates("database", "generic")
 
         assert len(templates) == 3
-        template_paths = [t[0] for t in templates]
-        assert any("alembic.ini" in p for p in template_paths)
-        assert any("env.py" in p for p in template_paths)
+        names = {Path(output).name for _, output in templates}
+        assert "alembic.ini" in names
+        assert "env.py" in names
 
     def test_ci_templates(self):
         """Test CI module templates."""
@@ -281,7 +351,8 @@ class TestGetModuleTemplates:
 
         assert len(templates) == 1
         template_paths = [t[0] for t in templates]
-        assert any("ci.yml" in p for p in template_paths)
+        names = {Path(output).name for _, output in templates}
+        assert "ci.yml" in names
         assert any(".github/workflows" in p for p in template_paths)
 
     def test_precommit_templates(self):
@@ -289,18 +360,100 @@ class TestGetModuleTemplates:
         templates = get_module_templates("precommit", "generic")
 
         assert len(templates) == 1
-        template_paths = [t[0] for t in templates]
-        assert any(".pre-commit-config.yaml" in p for p in template_paths)
+        names = {Path(output).name for _, output in templates}
+        assert ".pre-commit-config.yaml" in names
 
     def test_poetry_templates(self):
         """Test Poetry module templates."""
         templates = get_module_templates("poetry", "generic")
 
         assert len(templates) == 1
-        template_paths = [t[0] for t in templates]
-        assert any("pyproject.toml" in p for p in template_paths)
+        names = {Path(output).name for _, output in templates}
+        assert "pyproject.toml" in names
 
     def test_invalid_module(self):
-        """Test that invalid module returns empty list."""
+        """Test that invalid module returns no templates."""
         templates = get_module_templates("invalid", "generic")
-        assert templates == []
+        assert templates == ()
+
+
+class TestAddModule:
+    """Tests for add_module function."""
+
+    @pytest.fixture
+    def project(self, tmp_path):
+        """Create a minimal project to add modules to."""
+        (tmp_path / "pyproject.toml").write_text("[project]\nname = 'test'\n")
+        return tmp_path
+
+    def test_first_run_creates_files(self, project, capsys):
+        """Test that new files are reported as created."""
+        add_module("docker", str(project))
+
+        assert (project / "Dockerfile").exists()
+        assert (project / "docker-compose.yml").exists()
+        output = capsys.readouterr().out
+        assert "Created: Dockerfile" in output
+        assert "Updated" not in output
+
+    def test_files_use_lf_line_endings(self, project):
+        """Test that files are written as bytes, without newline translation."""
+        add_module("docker", str(project))
+
+        content = (project / "Dockerfile").read_bytes()
+        assert b"\n" in content
+        assert b"\r\n" not in content
+
+    def test_force_rerun_updates_files(self, project, capsys):
+        """Test that --force reports existing files as updated."""
+        add_module("docker", str(project))
+        capsys.readouterr()
+
+        add_module("docker", str(project), force=True)
+
+        output = capsys.readouterr().out
+        assert "Updated: Dockerfile" in output
+        assert "Created" not in output
+
+    def test_rerun_without_force_skips_files(self, project, capsys):
+        """Test that existing files are left alone without --force."""
+        add_module("docker", str(project))
+        (project / "Dockerfile").write_text("custom")
+        capsys.readouterr()
+
+        add_module("docker", str(project))
+
+        assert (project / "Dockerfile").read_text() == "custom"
+        output = capsys.readouterr().out
+        assert "Dockerfile (exists, use --force to overwrite)" in output
+        assert "Created" not in output
+        assert "Updated" not in output
+
+    def test_failed_file_reports_every_file(self, project, capsys):
+        """Test that one failing file doesn't hide the files that were written."""
+        (project / ".dockerignore").mkdir()
+
+        with pytest.raises(SystemExit):
+            add_module("docker", str(project), force=True)
+
+        assert (project / "Dockerfile").exists()
+        assert (project / "docker-compose.yml").exists()
+        output = capsys.readouterr().out
+        assert "Created: Dockerfile" in output
+        assert "Created: docker-compose.yml" in output
+        assert "✗ .dockerignore" in output
+        assert "Error adding module" in output
+
+    def test_failed_render_leaves_no_directories(self, project, monkeypatch):
+        """Test that output directories are only created for rendered files."""
+        engine = TemplateEngine()
+
+        def fail(template_path, context):
+            raise RuntimeError("render failed")
+
+        monkeypatch.setattr(engine, "render_template", fail)
+
+        with pytest.raises(SystemExit):
+            add_module("docs", str(project), engine=engine)
+
+        assert [p.name for p in project.iterdir()] == ["pyproject.toml"]
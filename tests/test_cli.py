@@ -0,0 +1,59 @@
+"""Tests for the gentem CLI entry point."""
+
+import sys
+
+import pytest
+
+from gentem.cli import app, main
+
+
+def run_main(monkeypatch, *args):
+    """Run main() with the given command-line arguments and return its exit code."""
+    monkeypatch.setattr(sys, "argv", ["gentem", *args])
+    with pytest.raises(SystemExit) as exc_info:
+        main()
+    return exc_info.value.code
+
+
+class TestMain:
+    """Tests for the main entry point."""
+
+    def test_help_lists_all_commands(self, monkeypatch, capsys):
+        """Test that top-level --help still lists every command."""
+        assert run_main(monkeypatch, "--help") == 0
+
+        output = capsys.readouterr().out
+        for command in ("new", "fastapi", "init", "add"):
+            assert command in output
+
+    def test_add_help(self, monkeypatch, capsys):
+        """Test that a subcommand's --help dispatches to that command."""
+        assert run_main(monkeypatch, "add", "--help") == 0
+
+        assert "--force" in capsys.readouterr().out
+
+    def test_new_dry_run(self, monkeypatch, tmp_path, capsys):
+        """Test that a subcommand with arguments still runs."""
+        monkeypatch.chdir(tmp_path)
+
+        assert run_main(monkeypatch, "new", "x", "--dry-run") == 0
+
+        assert "library/pyproject.toml.j2" in capsys.readouterr().out
+        assert list(tmp_path.iterdir()) == []
+
+    def test_unknown_command(self, monkeypatch, capsys):
+        """Test that an unknown command name is still rejected."""
+        assert run_main(monkeypatch, "bogus") == 2
+
+        assert "No such command" in capsys.readouterr().err
+
+    def test_app_keeps_every_command(self, monkeypatch, capsys):
+        """Test that running one command doesn't trim the module-level app."""
+        run_main(monkeypatch, "add", "--help")
+        capsys.readouterr()
+
+        names = {c.name for c in app.registered_commands}
+        assert names == {"new", "fastapi", "init", "add"}
+
+        assert run_main(monkeypatch, "init", "--help") == 0
+        assert "init" in capsys.readouterr().out
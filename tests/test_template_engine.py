@@ -1,10 +1,10 @@
 """Tests for the Jinja2 template engine module."""
 
-import tempfile
+import shutil
 from pathlib import Path
 
 import pytest
-from jinja2.exceptions import TemplateNotFound
+from jinja2.exceptions import TemplateNotFound, UndefinedError
 
 from gentem.template_engine import TemplateEngine, get_template_engine
 
@@ -18,17 +18,17 @@ class TestTemplateEngineInit:
         expected_dir = Path(__file__).parent.parent / "src" / "gentem" / "templates"
         assert engine.template_dir == expected_dir
 
-    def test_custom_template_dir(self):
+    def test_custom_template_dir(self, tmp_path):
         """Test with custom template directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            engine = TemplateEngine(template_dir=tmpdir)
-            assert engine.template_dir == Path(tmpdir)
+        engine = TemplateEngine(template_dir=str(tmp_path))
+        assert engine.template_dir == tmp_path
 
     def test_jinja2_environment_configured(self):
         """Test that Jinja2 environment is properly configured."""
         engine = TemplateEngine()
         assert engine.env is not None
-        assert engine.env.autoescape is True
+        assert engine.env.autoescape("pyproject.toml.j2") is False
+        assert engine.env.autoescape("index.html") is True
         assert engine.env.trim_blocks is True
         assert engine.env.lstrip_blocks is True
 
@@ -50,6 +50,13 @@ class TestGetTemplate:
         template = engine.get_template("base/gitignore.j2")
         assert template is not None
 
+    def test_get_template_is_cached(self):
+        """Test that repeated lookups reuse the compiled template."""
+        engine = TemplateEngine()
+        first = engine.get_template("base/gitignore.j2")
+        second = engine.get_template("base/gitignore.j2")
+        assert first is second
+
     def test_get_nonexistent_template(self):
         """Test error when template doesn't exist."""
         engine = TemplateEngine()
@@ -99,30 +106,40 @@ class TestRenderTemplate:
         assert "Test Author" in content
         assert "2024" in content
 
-    def test_all_license_types(self):
+    @pytest.mark.parametrize(
+        "template_path,expected",
+        [
+            ("base/license_mit.j2", "MIT License"),
+            ("base/license_apache.j2", "Apache License"),
+            ("base/license_bsd.j2", "BSD 3-Clause License"),
+            ("base/license_gpl.j2", "GNU GENERAL PUBLIC LICENSE"),
+        ],
+    )
+    def test_all_license_types(self, template_path, expected):
         """Test all license template rendering."""
-        engine = TemplateEngine()
+        engine = get_template_engine()
         context = {
             "author": "Test Author",
             "year": 2024,
         }
 
-        licenses = [
-            ("base/license_mit.j2", "MIT License"),
-            ("base/license_apache.j2", "Apache License"),
-            ("base/license_bsd.j2", "BSD 3-Clause License"),
-            ("base/license_gpl.j2", "GNU GENERAL PUBLIC LICENSE"),
-        ]
+        content = engine.render_template(template_path, context)
+        assert expected in content
 
-        for template_path, expected in licenses:
-            content = engine.render_template(template_path, context)
-            assert expected in content, f"Failed for {template_path}"
+    def test_values_are_not_html_escaped(self):
+        """Test that generated non-HTML files keep special characters as-is."""
+        engine = TemplateEngine()
+        content = engine.render_template(
+            "base/license_mit.j2",
+            {"author": "O'Brien & Sons <dev@example.com>", "year": 2024},
+        )
+        assert "O'Brien & Sons <dev@example.com>" in content
 
 
 class TestRenderFile:
     """Tests for the render_file method."""
 
-    def test_render_to_file(self):
+    def test_render_to_file(self, tmp_path):
         """Test rendering a template to a file."""
         engine = TemplateEngine()
         context = {
@@ -137,24 +154,70 @@ class TestRenderFile:
             "cli_enabled": False,
         }
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "test_output.txt"
-            engine.render_file("library/pyproject.toml.j2", context, output_path)
+        output_path = tmp_path / "test_output.txt"
+        engine.render_file("library/pyproject.toml.j2", context, output_path)
 
-            assert output_path.exists()
-            content = output_path.read_text(encoding="utf-8")
-            assert 'name = "testproject"' in content
+        assert output_path.exists()
+        content = output_path.read_text(encoding="utf-8")
+        assert 'name = "testproject"' in content
 
-    def test_creates_parent_directories(self):
+    def test_creates_parent_directories(self, tmp_path):
         """Test that render_file creates parent directories."""
         engine = TemplateEngine()
         context = {"project_slug": "testproject"}
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "nested" / "deep" / "output.txt"
-            engine.render_file("base/gitignore.j2", context, output_path)
+        output_path = tmp_path / "nested" / "deep" / "output.txt"
+        engine.render_file("base/gitignore.j2", context, output_path)
 
-            assert output_path.exists()
+        assert output_path.exists()
+
+    def test_recreates_removed_parent_directories(self, tmp_path):
+        """Test that a reused engine recreates directories deleted between renders."""
+        engine = TemplateEngine()
+        context = {"project_slug": "testproject"}
+        output_path = tmp_path / "proj" / "src" / "output.txt"
+
+        engine.render_file("base/gitignore.j2", context, output_path)
+        shutil.rmtree(tmp_path / "proj")
+        engine.render_file("base/gitignore.j2", context, output_path)
+
+        assert output_path.exists()
+
+    def test_failed_render_leaves_no_file(self, tmp_path):
+        """Test that a render error doesn't leave a partial file behind."""
+        engine = TemplateEngine()
+        output_path = tmp_path / "Dockerfile"
+
+        # The Dockerfile template indexes python_versions, which is undefined here
+        with pytest.raises(UndefinedError):
+            engine.render_file("add/docker/Dockerfile.j2", {}, output_path)
+
+        assert not output_path.exists()
+        assert list(tmp_path.iterdir()) == []
+
+    def test_failed_render_keeps_existing_file(self, tmp_path):
+        """Test that a render error leaves an existing file untouched."""
+        engine = TemplateEngine()
+        output_path = tmp_path / "Dockerfile"
+        output_path.write_text("FROM python:3.12\n")
+
+        with pytest.raises(UndefinedError):
+            engine.render_file("add/docker/Dockerfile.j2", {}, output_path)
+
+        assert output_path.read_text() == "FROM python:3.12\n"
+        assert list(tmp_path.iterdir()) == [output_path]
+
+    def test_overwrite_keeps_file_mode(self, tmp_path):
+        """Test that re-rendering over an existing file keeps its permissions."""
+        engine = TemplateEngine()
+        output_path = tmp_path / "output.txt"
+        output_path.write_text("old")
+        output_path.chmod(0o640)
+
+        engine.render_file("base/gitignore.j2", {"project_slug": "test"}, output_path)
+
+        assert output_path.read_text() != "old"
+        assert output_path.stat().st_mode & 0o777 == 0o640
 
 
 class TestListTemplates:
@@ -183,6 +246,23 @@ class TestListTemplates:
             assert len(parts) >= 1, f"Template path '{t}' has no parts"
             assert parts[0] == "library", f"Template path '{t}' doesn't start with 'library'"
 
+    @pytest.mark.parametrize("subdir", [".", "./", ""])
+    def test_current_directory_lists_all_templates(self, subdir):
+        """Test that "." means no filter, as an empty subdir does."""
+        engine = TemplateEngine()
+
+        assert engine.list_templates(subdir) == engine.list_templates()
+
+    @pytest.mark.parametrize("subdir", ["add/docker", "add/docker/", "./add/docker"])
+    def test_list_nested_subdirectory_templates(self, subdir):
+        """Test nested subdirectories, with or without a trailing slash."""
+        engine = TemplateEngine()
+        templates = engine.list_templates(subdir)
+
+        assert str(Path("add/docker/Dockerfile.j2")) in templates
+        for t in templates:
+            assert Path(t).parts[:2] == ("add", "docker")
+
     def test_list_nonexistent_subdirectory(self):
         """Test listing templates in nonexistent subdirectory returns empty."""
         engine = TemplateEngine()
@@ -1,21 +1,21 @@
 """Integration tests for template rendering with Jinja2 features."""
 
-import tempfile
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
 from gentem.template_engine import TemplateEngine
 
 
+@pytest.fixture(scope="module")
+def engine():
+    """Create a TemplateEngine instance shared by the tests in this module."""
+    return TemplateEngine()
+
+
 class TestTemplateRendering:
     """Tests for template rendering with various Jinja2 features."""
 
-    @pytest.fixture
-    def engine(self):
-        """Create a TemplateEngine instance for testing."""
-        return TemplateEngine()
-
     @pytest.fixture
     def context(self):
         """Create a standard context for testing."""
@@ -125,88 +125,82 @@ class TestLoopRendering(TestTemplateRendering):
 class TestFileGeneration(TestTemplateRendering):
     """Tests for actual file generation from templates."""
 
-    def test_generate_library_project(self, engine, context):
-        """Test generating a full library project structure."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "my-test-project"
-            output_path.mkdir()
-
-            # Generate all library files
-            template_files = [
-                ("base/gitignore.j2", ".gitignore"),
-                ("library/pyproject.toml.j2", "pyproject.toml"),
-                ("library/README.md.j2", "README.md"),
-                ("library/src/__init__.py.j2", "src/__init__.py"),
+    @staticmethod
+    def render_files(engine, context, output_path, template_files):
+        """Render each (template, output file) pair under output_path concurrently."""
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(engine.render_file, template_path, context, output_path / output)
+                for template_path, output in template_files
             ]
+        # Surface any render error in the calling test
+        for future in futures:
+            future.result()
 
-            for template_path, output_file in template_files:
-                engine.render_file(
-                    template_path,
-                    context,
-                    output_path / output_file,
-                )
-
-            # Verify files were created
-            assert (output_path / ".gitignore").exists()
-            assert (output_path / "pyproject.toml").exists()
-            assert (output_path / "README.md").exists()
-            assert (output_path / "src" / "__init__.py").exists()
-
-            # Verify content - gitignore is static, check pyproject.toml for project_slug
-            pyproject_content = (output_path / "pyproject.toml").read_text()
-            assert "my-test-project" in pyproject_content
-
-    def test_generate_fastapi_project(self, engine, context):
+    def test_generate_library_project(self, engine, context, tmp_path):
+        """Test generating a full library project structure."""
+        output_path = tmp_path / "my-test-project"
+        output_path.mkdir()
+
+        # Generate all library files
+        template_files = [
+            ("base/gitignore.j2", ".gitignore"),
+            ("library/pyproject.toml.j2", "pyproject.toml"),
+            ("library/README.md.j2", "README.md"),
+            ("library/src/__init__.py.j2", "src/__init__.py"),
+        ]
+
+        self.render_files(engine, context, output_path, template_files)
+
+        # Verify files were created
+        assert (output_path / ".gitignore").exists()
+        assert (output_path / "pyproject.toml").exists()
+        assert (output_path / "README.md").exists()
+        assert (output_path / "src" / "__init__.py").exists()
+
+        # Verify content - gitignore is static, check pyproject.toml for project_slug
+        pyproject_content = (output_path / "pyproject.toml").read_text()
+        assert "my-test-project" in pyproject_content
+
+    def test_generate_fastapi_project(self, engine, context, tmp_path):
         """Test generating a full FastAPI project structure."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "my-api"
-            output_path.mkdir()
-
-            # Generate FastAPI files
-            template_files = [
-                ("fastapi/pyproject.toml.j2", "pyproject.toml"),
-                ("fastapi/app/main.py.j2", "app/main.py"),
-                ("fastapi/app/core/config.py.j2", "app/core/config.py"),
-            ]
+        output_path = tmp_path / "my-api"
+        output_path.mkdir()
 
-            for template_path, output_file in template_files:
-                engine.render_file(
-                    template_path,
-                    context,
-                    output_path / output_file,
-                )
+        # Generate FastAPI files
+        template_files = [
+            ("fastapi/pyproject.toml.j2", "pyproject.toml"),
+            ("fastapi/app/main.py.j2", "app/main.py"),
+            ("fastapi/app/core/config.py.j2", "app/core/config.py"),
+        ]
 
-            # Verify files were created
-            assert (output_path / "pyproject.toml").exists()
-            assert (output_path / "app" / "main.py").exists()
-            assert (output_path / "app" / "core" / "config.py").exists()
+        self.render_files(engine, context, output_path, template_files)
 
-    def test_generate_cli_project(self, engine, context):
+        # Verify files were created
+        assert (output_path / "pyproject.toml").exists()
+        assert (output_path / "app" / "main.py").exists()
+        assert (output_path / "app" / "core" / "config.py").exists()
+
+    def test_generate_cli_project(self, engine, context, tmp_path):
         """Test generating a CLI project structure."""
         context["cli_enabled"] = True
         context["library_enabled"] = False
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "my-cli"
-            output_path.mkdir()
+        output_path = tmp_path / "my-cli"
+        output_path.mkdir()
 
-            template_files = [
-                ("cli/pyproject.toml.j2", "pyproject.toml"),
-                ("cli/src/main.py.j2", "src/main.py"),
-                ("cli/src/cli.py.j2", "src/cli.py"),
-            ]
+        template_files = [
+            ("cli/pyproject.toml.j2", "pyproject.toml"),
+            ("cli/src/main.py.j2", "src/main.py"),
+            ("cli/src/cli.py.j2", "src/cli.py"),
+        ]
+
+        self.render_files(engine, context, output_path, template_files)
 
-            for template_path, output_file in template_files:
-                engine.render_file(
-                    template_path,
-                    context,
-                    output_path / output_file,
-                )
-
-            # Verify files were created
-            assert (output_path / "pyproject.toml").exists()
-            assert (output_path / "src" / "main.py").exists()
-            assert (output_path / "src" / "cli.py").exists()
+        # Verify files were created
+        assert (output_path / "pyproject.toml").exists()
+        assert (output_path / "src" / "main.py").exists()
+        assert (output_path / "src" / "cli.py").exists()
 
 
 class TestTemplateEdgeCases(TestTemplateRendering):
@@ -29,6 +29,7 @@ class TestValidatePythonIdentifier:
         assert validate_python_identifier("my-project") is False
         assert validate_python_identifier("my.project") is False
         assert validate_python_identifier("") is False
+        assert validate_python_identifier("café") is False
 
 
 class TestValidateProjectName:
@@ -56,7 +57,7 @@ class TestValidateProjectName:
 
     def test_reserved_words(self):
         """Test that reserved words are rejected."""
-        for word in ["class", "def", "import", "return", "if", "else"]:
+        for word in ["class", "def", "import", "return", "if", "else", "Class", "None", "True"]:
             with pytest.raises(ValidationError) as exc_info:
                 validate_project_name(word)
             assert "reserved word" in str(exc_info.value)
@@ -117,3 +118,27 @@ class TestValidateDbType:
         with pytest.raises(ValidationError) as exc_info:
             validate_db_type("mysql")
         assert "Invalid database type" in str(exc_info.value)
+
+
+class TestUtilsPackageExports:
+    """Tests for the lazy re-exports in gentem.utils."""
+
+    def test_exports_resolve_to_validators(self):
+        """Test that every name in __all__ resolves to the validators function."""
+        from gentem.utils import (
+            validate_license_type,
+            validate_project_name,
+            validate_python_identifier,
+            validators,
+        )
+
+        assert validate_project_name is validators.validate_project_name
+        assert validate_python_identifier is validators.validate_python_identifier
+        assert validate_license_type is validators.validate_license_type
+
+    def test_unknown_attribute_raises(self):
+        """Test that names outside __all__ raise AttributeError."""
+        import gentem.utils
+
+        with pytest.raises(AttributeError):
+            gentem.utils.validate_nothing  # noqa: B018